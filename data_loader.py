@@ -1,35 +1,34 @@
-import csv
-from datetime import datetime
-from models import MarketDataPoint
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Optional
+from models import MarketData
 
-def parse_timestamp(timestamp_str: str) -> datetime:
-    clean_str = timestamp_str[:-6]
-    return datetime.strptime(clean_str, "%Y-%m-%d %H:%M:%S")
+def _read_market_data(filename: str, limit: Optional[int] = None) -> MarketData:
+    df = pd.read_csv(filename, usecols=['timestamp', 'symbol', 'price'], nrows=limit, float_precision='round_trip')
+    timestamps = pd.to_datetime(df['timestamp'].str.slice(0, -6), format="%Y-%m-%d %H:%M:%S")
 
-def load_market_data(filename: str) -> list[MarketDataPoint]:
-    data_points = []
-    with open(filename, 'r') as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            point = MarketDataPoint(
-                timestamp = parse_timestamp(row['timestamp']),
-                symbol = row('symbol'),
-                price = float(row('price'))
-            )
-            data_points.append(point)
-    return data_points
+    return MarketData(
+        timestamps = timestamps.to_numpy(dtype='datetime64[ns]'),
+        symbols = df['symbol'].to_numpy(dtype=object),
+        prices = df['price'].to_numpy(dtype=np.float64)
+    )
 
-def load_market_data_limited(filename: str, limit: int) -> list[MarketDataPoint]:
-    data_points = []
-    with open(filename, 'r') as file:
-        reader = csv.DictReader(file)
-        for i, row in enumerate(reader):
-            if i >= limit:
-                break
-            point = MarketDataPoint(
-                timestamp = parse_timestamp(row['timestamp']),
-                symbol = row['symbol'],
-                price = float(row['price'])
-            )
-            data_points.append(point)
-    return data_points
\ No newline at end of file
+def load_market_data(filename: str) -> MarketData:
+    return _read_market_data(filename)
+
+def load_market_data_limited(filename: str, limit: int) -> MarketData:
+    return _read_market_data(filename, limit)
+
+def load_prices(filename: str) -> np.ndarray:
+    # parsed prices are cached next to the CSV as .npy, later runs memory-map it instead of re-parsing
+    cache_path = Path(filename).with_suffix('.npy')
+    if cache_path.exists() and cache_path.stat().st_mtime >= Path(filename).stat().st_mtime:
+        return np.load(cache_path, mmap_mode='r')
+
+    prices = pd.read_csv(filename, usecols=['price'], float_precision='round_trip')['price'].to_numpy(dtype=np.float64)
+    try:
+        np.save(cache_path, prices)
+    except OSError: # read-only checkout or directory, the cache is only an optimization
+        pass
+    return prices
@@ -1,10 +1,10 @@
 # download_data.py
 # Downloads real stock data and extends it with realistic synthetic data
 
+import sys
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
 
 # Step 1: Download real data for one stock
 print("\n[1/3] Downloading real ANET data from Yahoo Finance...")
@@ -48,32 +48,17 @@ minute_volatility = 0.0005
 # Generate random returns
 random_returns = np.random.normal(0, minute_volatility, rows_needed)
 
-# Convert returns to prices
-synthetic_prices = [last_real_price]
-for ret in random_returns:
-    new_price = synthetic_prices[-1] * (1 + ret)
-    synthetic_prices.append(new_price)
-
-synthetic_prices = synthetic_prices[1:]
-
-# Generate timestamps (1 minute apart)
-synthetic_timestamps = []
-current_time = last_real_timestamp
-
-for i in range(rows_needed):
-    current_time = current_time + timedelta(minutes=1)
-    
-    # Skip weekends
-    while current_time.weekday() >= 5:
-        current_time = current_time + timedelta(days=1)
-        current_time = current_time.replace(hour=9, minute=30)
-    
-    # Keep market hours
-    if current_time.hour >= 16:
-        current_time = current_time + timedelta(days=1)
-        current_time = current_time.replace(hour=9, minute=30)
-    
-    synthetic_timestamps.append(current_time)
+# Convert returns to prices (cumulative product of the growth factors)
+synthetic_prices = last_real_price * np.cumprod(1.0 + random_returns)
+
+# Generate timestamps (1 minute apart, weekdays 9:30-16:00 only)
+# Only 390 of every 1440 minutes on 5 of 7 days are market minutes, so build a long enough calendar range and mask it
+calendar_minutes = rows_needed * (7 * 1440) // (5 * 390) + 7 * 1440
+candidate_times = pd.date_range(last_real_timestamp + pd.Timedelta(minutes=1), periods=calendar_minutes, freq='1min')
+
+minute_of_day = candidate_times.hour * 60 + candidate_times.minute
+market_open = (candidate_times.dayofweek < 5) & (minute_of_day >= 9 * 60 + 30) & (minute_of_day < 16 * 60)
+synthetic_timestamps = candidate_times[market_open][:rows_needed]
 
 # Create synthetic dataframe
 synthetic_data = pd.DataFrame({
@@ -104,41 +89,44 @@ print(combined.head(10))
 # VISUALIZATION
 # ============================================
 
-import matplotlib.pyplot as plt
-
-print("\nGenerating price charts...")
-
-# Chart 1: Full series
-plt.figure(figsize=(14, 6))
-plt.plot(combined['price'].values, linewidth=0.5, color='blue', alpha=0.7)
-real_data_end = len(real_data)
-plt.axvline(x=real_data_end, color='red', linestyle='--', linewidth=1, label='Real → Synthetic')
-plt.title('ANET Price Series (Real + Synthetic Data)', fontsize=14)
-plt.xlabel('Tick Number', fontsize=12)
-plt.ylabel('Price ($)', fontsize=12)
-plt.legend()
-plt.tight_layout()
-plt.savefig('price_series.png', dpi=150)
-
-# Chart 2: Zoomed views
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-
-axes[0].plot(real_data['price'].values, linewidth=0.5, color='green')
-axes[0].set_title('Real ANET Data (Zoomed)', fontsize=12)
-axes[0].set_xlabel('Tick Number')
-axes[0].set_ylabel('Price ($)')
-axes[0].grid(True, alpha=0.3)
-
-axes[1].plot(combined['price'].values[:10000], linewidth=0.5, color='blue')
-axes[1].axvline(x=len(real_data), color='red', linestyle='--', linewidth=2, label='Real → Synthetic')
-axes[1].set_title('First 10,000 Ticks (Shows Transition)', fontsize=12)
-axes[1].set_xlabel('Tick Number')
-axes[1].set_ylabel('Price ($)')
-axes[1].legend()
-axes[1].grid(True, alpha=0.3)
-
-plt.tight_layout()
-plt.savefig('price_series_zoomed.png', dpi=150)
-
-print("✅ Saved charts")
-plt.show()
+# Charts are opt-in (python download_data.py --plots); the default run only writes the CSV
+if '--plots' in sys.argv:
+    import matplotlib
+    matplotlib.use('Agg') # non-interactive backend, charts are only saved to disk
+    import matplotlib.pyplot as plt
+
+    print("\nGenerating price charts...")
+
+    # Chart 1: Full series
+    plt.figure(figsize=(14, 6))
+    plt.plot(combined['price'].values, linewidth=0.5, color='blue', alpha=0.7)
+    real_data_end = len(real_data)
+    plt.axvline(x=real_data_end, color='red', linestyle='--', linewidth=1, label='Real → Synthetic')
+    plt.title('ANET Price Series (Real + Synthetic Data)', fontsize=14)
+    plt.xlabel('Tick Number', fontsize=12)
+    plt.ylabel('Price ($)', fontsize=12)
+    plt.legend()
+    plt.tight_layout()
+    plt.savefig('price_series.png', dpi=150)
+
+    # Chart 2: Zoomed views
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+
+    axes[0].plot(real_data['price'].values, linewidth=0.5, color='green')
+    axes[0].set_title('Real ANET Data (Zoomed)', fontsize=12)
+    axes[0].set_xlabel('Tick Number')
+    axes[0].set_ylabel('Price ($)')
+    axes[0].grid(True, alpha=0.3)
+
+    axes[1].plot(combined['price'].values[:10000], linewidth=0.5, color='blue')
+    axes[1].axvline(x=len(real_data), color='red', linestyle='--', linewidth=2, label='Real → Synthetic')
+    axes[1].set_title('First 10,000 Ticks (Shows Transition)', fontsize=12)
+    axes[1].set_xlabel('Tick Number')
+    axes[1].set_ylabel('Price ($)')
+    axes[1].legend()
+    axes[1].grid(True, alpha=0.3)
+
+    plt.tight_layout()
+    plt.savefig('price_series_zoomed.png', dpi=150)
+
+    print("✅ Saved charts")
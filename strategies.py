@@ -1,5 +1,58 @@
-from collections import deque
-from models import MarketDataPoint, Strategy
+from array import array
+from functools import reduce
+from operator import add
+import numpy as np
+from models import Signal, Strategy
+
+try:
+    from strategies_fast import naive_signals, windowed_signals, make_naive_kernel, MAX_SPECIALIZED_WINDOW
+except ImportError: # numba not installed, process_batch falls back to NumPy
+    naive_signals = windowed_signals = make_naive_kernel = None
+
+def moving_average_signals(prices, window_size):
+    """
+    Vectorized moving average signals: 1 (Long), -1 (Short), 0 (Hold).
+
+    Time Complexity: O(n*k), every window sum is built from k shifted slices in one NumPy pass each.
+    The slices are added oldest first, the same left-to-right order as the naive strategy, so the averages are bit-identical to it.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    signals = np.zeros(len(prices), dtype=np.int8) # first window_size - 1 ticks stay Hold
+
+    if len(prices) < window_size:
+        return signals
+
+    count = len(prices) - window_size + 1
+    sums = prices[:count].copy()
+    for offset in range(1, window_size): # not a cumsum difference, whose rounding error grows with n and breaks ties
+        sums += prices[offset:offset + count]
+
+    averages = sums / window_size
+    signals[window_size - 1:] = np.sign(prices[window_size - 1:] - averages) # branchless: 1, -1 or 0
+
+    return signals
+
+def running_average_signals(prices, window_size):
+    """
+    Vectorized running-sum signals: 1 (Long), -1 (Short), 0 (Hold).
+
+    Time Complexity: O(n), one cumulative sum over the incoming minus outgoing price of every tick.
+    np.cumsum accumulates sequentially, the same `running_sum += price - old` order as the windowed strategy,
+    so the averages are bit-identical to it.
+    """
+    prices = np.asarray(prices, dtype=np.float64)
+    signals = np.zeros(len(prices), dtype=np.int8) # first window_size - 1 ticks stay Hold
+
+    if len(prices) < window_size:
+        return signals
+
+    outgoing = np.zeros(len(prices)) # 0.0 until the window is full, like the ring buffer's empty slots
+    outgoing[window_size:] = prices[:-window_size]
+
+    averages = np.cumsum(prices - outgoing)[window_size - 1:] / window_size
+    signals[window_size - 1:] = np.sign(prices[window_size - 1:] - averages) # branchless: 1, -1 or 0
+
+    return signals
 
 class NaiveMovingAverageStrategy(Strategy):
     """
@@ -15,57 +68,89 @@ class NaiveMovingAverageStrategy(Strategy):
         self.window_size = window_size
         self.price_history = [] # O(n) space
 
-    def generate_signals(self, tick: MarketDataPoint) -> list:
-        self.price_history.append(tick.price) # O(1) time
+    def generate_signals_from_price(self, price: float) -> Signal:
+        self.price_history.append(price) # O(1) time
 
         if len(self.price_history) < self.window_size: # O(1) time
-            return ["Hold"]
+            return Signal.HOLD
 
         window = self.price_history[-self.window_size:] # O(k) time, slicing creates a new list by copying the last k elements one by one
-        average = sum(window) / self.window_size # O(k) time to sum the k window
-
-        if tick.price > average: # O(1) time
-            return ["Long"]
-        elif tick.price < average: # O(1) time
-            return ["Short"]
+        # O(k) time to sum the k window; explicit left-to-right adds, since sum() of floats is compensated from Python 3.12
+        # and the batch kernels must reproduce this exact order
+        average = reduce(add, window) / self.window_size
+
+        if price > average: # O(1) time
+            return Signal.LONG
+        elif price < average: # O(1) time
+            return Signal.SHORT
         else: # O(1) time
-            return ["Hold"]
+            return Signal.HOLD
+
+    def process_batch(self, prices):
+        """
+        Signals for a whole price array in one compiled call: 1 (Long), -1 (Short), 0 (Hold).
+        """
+        prices = np.ascontiguousarray(prices, dtype=np.float64) # the kernels' eager signature only accepts float64 arrays
+        if naive_signals is None:
+            return moving_average_signals(prices, self.window_size)
+        if self.window_size <= MAX_SPECIALIZED_WINDOW:
+            return make_naive_kernel(self.window_size)(prices)
+        return naive_signals(prices, self.window_size)
 
 
 class WindowedMovingAverageStrategy(Strategy):
     """
     Windowed Moving Average Strategy
 
-    Space Complexity: O(k) where k is the window size because it only stores the window deque and its running sum.
+    Space Complexity: O(k) where k is the window size because it only stores a fixed ring buffer of k floats and its running sum.
     Space is constant regardless of the number of ticks.
 
-    Time Complexity: O(1) per tick because it only appends and pops from the deque and updates the running sum.
+    Time Complexity: O(1) per tick because it only overwrites the oldest slot of the ring buffer and updates the running sum.
     O(n) for n ticks.
     """
     def __init__(self, window_size: int = 10):
         self.window_size = window_size
-        self.window = deque(maxlen = window_size)  # O(k) space
+        self.buffer = array('d', [0.0]) * window_size # O(k) space, preallocated ring buffer of raw float64 slots
+        self.index = 0 # O(1) space, next slot to overwrite (the oldest price once the window is full)
+        self.count = 0 # O(1) space, prices seen so far, capped at window_size
         self.running_sum = 0.0   # O(1) space
-    
-    def generate_signals(self, tick:MarketDataPoint) -> list:
-        if len(self.window) == self.window_size: # O(1) time
-            self.running_sum -= self.window[0] # O(1) time to pop the first element from deque
-
-        self.window.append(tick.price) # O(1) time to append the new element to the deque
-        self.running_sum += tick.price # O(1) time to update the running sum
-
-        if len(self.window) < self.window_size: # O(1) time
-            return ["Hold"]
-        
-        average = self.running_sum / self.window_size # O(1) time to calculate the average (no summing operations)
-
-        if tick.price > average: # O(1) time
-            return ["Long"]
-        elif tick.price < average: # O(1) time
-            return ["Short"]
-        else: # O(1) time
-            return ["Hold"]
-
-
-
 
+    @property
+    def window(self) -> list:
+        # prices currently in the window, oldest first
+        if self.count < self.window_size:
+            return self.buffer[:self.count].tolist()
+        return (self.buffer[self.index:] + self.buffer[:self.index]).tolist()
+
+    def generate_signals_from_price(self, price: float) -> Signal:
+        window_size = self.window_size
+        buffer = self.buffer
+        index = self.index
+
+        old = buffer[index] # O(1) time, still 0.0 until the window is full
+        buffer[index] = price # O(1) time to overwrite the oldest slot in place
+        self.index = index + 1 if index + 1 < window_size else 0 # O(1) time to advance the write position
+        self.running_sum += price - old # O(1) time to update the running sum with the incoming/outgoing pair
+
+        if self.count < window_size: # O(1) time
+            self.count += 1
+            if self.count < window_size:
+                return Signal.HOLD
+
+        average = self.running_sum / window_size # O(1) time to calculate the average (no summing operations)
+
+        if price > average: # O(1) time
+            return Signal.LONG
+        elif price < average: # O(1) time
+            return Signal.SHORT
+        else: # O(1) time
+            return Signal.HOLD
+
+    def process_batch(self, prices):
+        """
+        Signals for a whole price array in one compiled call: 1 (Long), -1 (Short), 0 (Hold).
+        """
+        prices = np.ascontiguousarray(prices, dtype=np.float64) # the kernels' eager signature only accepts float64 arrays
+        if windowed_signals is None:
+            return running_average_signals(prices, self.window_size)
+        return windowed_signals(prices, self.window_size)
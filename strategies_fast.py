@@ -0,0 +1,90 @@
+from functools import lru_cache
+import numpy as np
+from numba import njit, types
+
+# eager signature so kernels compile at import time; read-only also accepts the read-only arrays pandas returns
+# kernels are compiled with nogil=True: they touch no Python objects, so threads calling them run concurrently
+PRICES = types.Array(types.float64, 1, 'A', readonly=True)
+SIGNATURE = types.int8[::1](PRICES, types.int64)
+
+# windows up to this size get a naive kernel with the window baked in as a compile-time constant
+MAX_SPECIALIZED_WINDOW = 64
+
+@njit(SIGNATURE, nogil=True, cache=True)
+def naive_signals(prices, window):
+    """
+    Compiled batch version of NaiveMovingAverageStrategy.
+
+    Returns an int8 array with 1 (Long), -1 (Short) or 0 (Hold) for every tick.
+    Time Complexity: O(n*k) like the naive strategy, but each window sum runs as machine code.
+    """
+    n = prices.shape[0]
+    signals = np.empty(n, np.int8)
+
+    for i in range(n):
+        if i < window - 1:
+            signals[i] = 0
+            continue
+
+        s = 0.0
+        for j in range(i - window + 1, i + 1): # O(k) time, same left-to-right order as the naive strategy
+            s += prices[j]
+        average = s / window
+
+        signals[i] = (prices[i] > average) - (prices[i] < average) # branchless: 1, -1 or 0
+
+    return signals
+
+@njit(SIGNATURE, nogil=True, cache=True)
+def windowed_signals(prices, window):
+    """
+    Compiled batch version of WindowedMovingAverageStrategy.
+
+    Returns an int8 array with 1 (Long), -1 (Short) or 0 (Hold) for every tick.
+    Time Complexity: O(1) per tick, a scalar running sum replaces the ring buffer.
+    """
+    signals = np.empty(prices.shape[0], np.int8)
+    running_sum = 0.0
+
+    for i in range(prices.shape[0]):
+        old = prices[i - window] if i >= window else 0.0
+        running_sum += prices[i] - old # same update as the ring buffer version
+
+        if i < window - 1:
+            signals[i] = 0
+            continue
+
+        average = running_sum / window
+
+        signals[i] = (prices[i] > average) - (prices[i] < average) # branchless: 1, -1 or 0
+
+    return signals
+
+@lru_cache(maxsize=None)
+def make_naive_kernel(window):
+    """
+    naive_signals specialized for one window size.
+
+    The window is a closure constant, so LLVM sees a fixed trip count and can unroll and vectorize the inner sum.
+    Each window size compiles once per process.
+    """
+    @njit(types.int8[::1](PRICES), nogil=True)
+    def kernel(prices):
+        n = prices.shape[0]
+        signals = np.empty(n, np.int8)
+
+        for i in range(n):
+            if i < window - 1:
+                signals[i] = 0
+                continue
+
+            s = 0.0
+            for j in range(window): # constant trip count, same left-to-right order as the naive strategy
+                s += prices[i - window + 1 + j]
+            average = s / window
+
+            signals[i] = (prices[i] > average) - (prices[i] < average) # branchless: 1, -1 or 0
+
+        return signals
+
+    return kernel
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# make the top-level modules (models, strategies, data_loader, ...) importable once for the whole test session
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))